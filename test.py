@@ -5,8 +5,11 @@ import sys
 import re
 import os
 import subprocess
-from enum import Enum, auto
-from dataclasses import dataclass
+import shutil
+import ctypes
+import math
+import operator
+from bisect import bisect_left
 from typing import List, Dict, Any, Optional, Union, Callable
 import llvmlite.binding as llvm
 import llvmlite.ir as ir
@@ -17,306 +20,267 @@ llvm.initialize_native_target()
 llvm.initialize_native_asmprinter()
 
 # ====== LEXER ======
-class TokenType(Enum):
-    INTEGER = auto()
-    FLOAT = auto()
-    PLUS = auto()
-    MINUS = auto()
-    MULTIPLY = auto()
-    DIVIDE = auto()
-    LPAREN = auto()
-    RPAREN = auto()
-    IDENTIFIER = auto()
-    ASSIGN = auto()
-    SEMICOLON = auto()
-    PRINT = auto()
-    IF = auto()
-    ELSE = auto()
-    LBRACE = auto()
-    RBRACE = auto()
-    EQUAL = auto()
-    NOT_EQUAL = auto()
-    LESS = auto()
-    GREATER = auto()
-    WHILE = auto()
-    EOF = auto()
-    STRING = auto()
+class TokenType:
+    # Plain ints rather than an Enum: the parser compares token types on
+    # every step, and Enum member access goes through the metaclass
+    INTEGER = 1
+    FLOAT = 2
+    PLUS = 3
+    MINUS = 4
+    MULTIPLY = 5
+    DIVIDE = 6
+    LPAREN = 7
+    RPAREN = 8
+    IDENTIFIER = 9
+    ASSIGN = 10
+    SEMICOLON = 11
+    PRINT = 12
+    IF = 13
+    ELSE = 14
+    LBRACE = 15
+    RBRACE = 16
+    EQUAL = 17
+    NOT_EQUAL = 18
+    LESS = 19
+    GREATER = 20
+    WHILE = 21
+    EOF = 22
+    STRING = 23
     # OOP related tokens
-    CLASS = auto()
-    NEW = auto()
-    DOT = auto()
-    EXTENDS = auto()
-    THIS = auto()
-    SUPER = auto()
-    FUNCTION = auto()
-    RETURN = auto()
-    COMMA = auto()
-
-@dataclass
-class Token:
-    type: TokenType
-    value: Any
-    line: int
-    column: int
+    CLASS = 24
+    NEW = 25
+    DOT = 26
+    EXTENDS = 27
+    THIS = 28
+    SUPER = 29
+    FUNCTION = 30
+    RETURN = 31
+    COMMA = 32
+
+_TOKEN_NAMES = {value: name for name, value in vars(TokenType).items() if name.isupper()}
+
+def token_name(token_type):
+    return f"TokenType.{_TOKEN_NAMES[token_type]}"
+
+# Tokens are plain (type, value, pos) tuples, where pos is the source offset;
+# Lexer.line_column turns it into a line and column only when reporting errors.
+
+_ESCAPE_CHARS = {
+    'n': '\n',
+    't': '\t',
+    'r': '\r',
+    '\\': '\\',
+    '"': '"'
+}
+
+_KEYWORDS = {
+    'print': TokenType.PRINT,
+    'if': TokenType.IF,
+    'else': TokenType.ELSE,
+    'while': TokenType.WHILE,
+    'class': TokenType.CLASS,
+    'new': TokenType.NEW,
+    'extends': TokenType.EXTENDS,
+    'this': TokenType.THIS,
+    'super': TokenType.SUPER,
+    'function': TokenType.FUNCTION,
+    'return': TokenType.RETURN
+}
+
+_OPERATORS = {
+    '+': TokenType.PLUS,
+    '-': TokenType.MINUS,
+    '*': TokenType.MULTIPLY,
+    '/': TokenType.DIVIDE,
+    '(': TokenType.LPAREN,
+    ')': TokenType.RPAREN,
+    '{': TokenType.LBRACE,
+    '}': TokenType.RBRACE,
+    ';': TokenType.SEMICOLON,
+    ',': TokenType.COMMA,
+    '.': TokenType.DOT,
+    '=': TokenType.ASSIGN,
+    '==': TokenType.EQUAL,
+    '!=': TokenType.NOT_EQUAL,
+    '<': TokenType.LESS,
+    '>': TokenType.GREATER
+}
+
+# Single pattern covering every lexeme; match.lastgroup names the kind.
+# ERROR catches any character no other alternative accepts (including a
+# '"' that starts an unterminated string), so matches are always contiguous.
+_MASTER = re.compile(r'''
+    (?P<WS>\s+)
+  | (?P<COMMENT>\#[^\n]*)
+  | (?P<FLOAT>\d+\.\d*)
+  | (?P<INT>\d+)
+  | (?P<STRING>"(?:[^"\\]|\\.)*")
+  | (?P<IDENT>[^\W\d]\w*)
+  | (?P<OP>==|!=|[+\-*/(){};,.=<>])
+  | (?P<ERROR>.)
+''', re.S | re.X)
+_RE_ESCAPE = re.compile(r'\\(.)', re.S)
+
+def _unescape(match):
+    char = match.group(1)
+    return _ESCAPE_CHARS.get(char, char)
 
 class Lexer:
     def __init__(self, source_code: str):
         self.source_code = source_code
-        self.position = 0
-        self.line = 1
-        self.column = 1
-        self.current_char = self.source_code[0] if self.source_code else None
-        
-    def advance(self):
-        if self.current_char == '\n':
-            self.line += 1
-            self.column = 1
-        else:
-            self.column += 1
-            
-        self.position += 1
-        self.current_char = self.source_code[self.position] if self.position < len(self.source_code) else None
-        
-    def skip_whitespace(self):
-        while self.current_char and self.current_char.isspace():
-            self.advance()
-            
-    def skip_comment(self):
-        while self.current_char and self.current_char != '\n':
-            self.advance()
-            
-    def number(self):
-        line, column = self.line, self.column
-        result = ""
-        is_float = False
-        
-        while self.current_char and (self.current_char.isdigit() or self.current_char == '.'):
-            if self.current_char == '.':
-                if is_float:  # Second decimal point is not allowed
-                    break
-                is_float = True
-            result += self.current_char
-            self.advance()
-            
-        if is_float:
-            return Token(TokenType.FLOAT, float(result), line, column)
-        else:
-            return Token(TokenType.INTEGER, int(result), line, column)
-            
-    def identifier(self):
-        line, column = self.line, self.column
-        result = ""
-        
-        while self.current_char and (self.current_char.isalnum() or self.current_char == '_'):
-            result += self.current_char
-            self.advance()
-            
-        # Keywords
-        keywords = {
-            'print': TokenType.PRINT,
-            'if': TokenType.IF,
-            'else': TokenType.ELSE,
-            'while': TokenType.WHILE,
-            'class': TokenType.CLASS,
-            'new': TokenType.NEW,
-            'extends': TokenType.EXTENDS,
-            'this': TokenType.THIS,
-            'super': TokenType.SUPER,
-            'function': TokenType.FUNCTION,
-            'return': TokenType.RETURN
-        }
-        
-        token_type = keywords.get(result, TokenType.IDENTIFIER)
-        return Token(token_type, result, line, column)
-        
-    def string(self):
-        line, column = self.line, self.column
-        self.advance()  # Skip opening quotation mark
-        result = ""
-        
-        while self.current_char and self.current_char != '"':
-            if self.current_char == '\\' and self.position + 1 < len(self.source_code):
-                self.advance()  # Skip the backslash
-                escape_chars = {
-                    'n': '\n',
-                    't': '\t',
-                    'r': '\r',
-                    '\\': '\\',
-                    '"': '"'
-                }
-                result += escape_chars.get(self.current_char, self.current_char)
-            else:
-                result += self.current_char
-            self.advance()
-            
-        if self.current_char is None:
-            raise SyntaxError(f"Unterminated string at line {line}, column {column}")
-            
-        self.advance()  # Skip closing quotation mark
-        return Token(TokenType.STRING, result, line, column)
-    
-    def get_next_token(self):
-        while self.current_char:
-            # Skip whitespace
-            if self.current_char.isspace():
-                self.skip_whitespace()
+        # Offsets of every newline; line/column are derived from these on demand
+        self._newlines = [m.start() for m in re.finditer('\n', source_code)]
+        self._scanner = None
+        self._last_token = None
+        
+    def line_column(self, pos):
+        line = bisect_left(self._newlines, pos)
+        if line:
+            return line + 1, pos - self._newlines[line - 1]
+        return 1, pos + 1
+        
+    def iter_tokens(self):
+        intern = sys.intern
+        
+        for match in _MASTER.finditer(self.source_code):
+            kind = match.lastgroup
+            if kind == 'WS' or kind == 'COMMENT':
                 continue
                 
-            # Skip comments
-            if self.current_char == '#':
-                self.skip_comment()
-                continue
-                
-            # Numbers
-            if self.current_char.isdigit():
-                return self.number()
-                
-            # Identifiers
-            if self.current_char.isalpha() or self.current_char == '_':
-                return self.identifier()
-                
-            # Strings
-            if self.current_char == '"':
-                return self.string()
-                
-            # Operators and punctuation
-            line, column = self.line, self.column
+            text = match.group()
+            start = match.start()
             
-            if self.current_char == '+':
-                self.advance()
-                return Token(TokenType.PLUS, '+', line, column)
-                
-            if self.current_char == '-':
-                self.advance()
-                return Token(TokenType.MINUS, '-', line, column)
-                
-            if self.current_char == '*':
-                self.advance()
-                return Token(TokenType.MULTIPLY, '*', line, column)
-                
-            if self.current_char == '/':
-                self.advance()
-                return Token(TokenType.DIVIDE, '/', line, column)
-                
-            if self.current_char == '(':
-                self.advance()
-                return Token(TokenType.LPAREN, '(', line, column)
-                
-            if self.current_char == ')':
-                self.advance()
-                return Token(TokenType.RPAREN, ')', line, column)
-                
-            if self.current_char == '{':
-                self.advance()
-                return Token(TokenType.LBRACE, '{', line, column)
-                
-            if self.current_char == '}':
-                self.advance()
-                return Token(TokenType.RBRACE, '}', line, column)
-                
-            if self.current_char == ';':
-                self.advance()
-                return Token(TokenType.SEMICOLON, ';', line, column)
-                
-            if self.current_char == ',':
-                self.advance()
-                return Token(TokenType.COMMA, ',', line, column)
-                
-            if self.current_char == '.':
-                self.advance()
-                return Token(TokenType.DOT, '.', line, column)
-                
-            if self.current_char == '=':
-                self.advance()
-                if self.current_char == '=':
-                    self.advance()
-                    return Token(TokenType.EQUAL, '==', line, column)
-                return Token(TokenType.ASSIGN, '=', line, column)
-                
-            if self.current_char == '!':
-                self.advance()
-                if self.current_char == '=':
-                    self.advance()
-                    return Token(TokenType.NOT_EQUAL, '!=', line, column)
-                raise SyntaxError(f"Unexpected character '!' at line {line}, column {column}")
-                
-            if self.current_char == '<':
-                self.advance()
-                return Token(TokenType.LESS, '<', line, column)
-                
-            if self.current_char == '>':
-                self.advance()
-                return Token(TokenType.GREATER, '>', line, column)
-                
-            # Unknown character
-            raise SyntaxError(f"Unexpected character '{self.current_char}' at line {line}, column {column}")
+            if kind == 'OP':
+                yield (_OPERATORS[text], text, start)
+            elif kind == 'IDENT':
+                # One dict probe tells keywords apart (a trie-shaped KEYWORD
+                # regex group measured no faster)
+                keyword = _KEYWORDS.get(text)
+                if keyword is not None:
+                    yield (keyword, text, start)
+                else:
+                    # Interned names hash once and compare by identity in the
+                    # resolver's and interpreter's name tables
+                    yield (TokenType.IDENTIFIER, intern(text), start)
+            elif kind == 'INT':
+                yield (TokenType.INTEGER, int(text), start)
+            elif kind == 'FLOAT':
+                yield (TokenType.FLOAT, float(text), start)
+            elif kind == 'STRING':
+                value = text[1:-1]
+                if '\\' in value:
+                    value = _RE_ESCAPE.sub(_unescape, value)
+                yield (TokenType.STRING, value, start)
+            else:
+                line, column = self.line_column(start)
+                if text == '"':
+                    raise SyntaxError(f"Unterminated string at line {line}, column {column}")
+                raise SyntaxError(f"Unexpected character '{text}' at line {line}, column {column}")
                 
-        return Token(TokenType.EOF, None, self.line, self.column)
+        yield (TokenType.EOF, None, len(self.source_code))
+    
+    def get_next_token(self):
+        if self._scanner is None:
+            self._scanner = self.iter_tokens()
+        # Keep returning EOF once the source is exhausted
+        self._last_token = next(self._scanner, self._last_token)
+        return self._last_token
     
     def tokenize(self):
-        tokens = []
-        while True:
-            token = self.get_next_token()
-            tokens.append(token)
-            if token.type == TokenType.EOF:
-                break
-        return tokens
+        return list(self.iter_tokens())
 
 # ====== PARSER ======
 class ASTNode:
-    pass
+    __slots__ = ()
+
+# Python callables implementing each operator, resolved once per node at parse time
+_BINARY_OPERATORS = {
+    TokenType.PLUS: operator.add,
+    TokenType.MINUS: operator.sub,
+    TokenType.MULTIPLY: operator.mul,
+    TokenType.DIVIDE: operator.truediv,
+    TokenType.EQUAL: operator.eq,
+    TokenType.NOT_EQUAL: operator.ne,
+    TokenType.LESS: operator.lt,
+    TokenType.GREATER: operator.gt
+}
+
+_UNARY_OPERATORS = {
+    TokenType.PLUS: operator.pos,
+    TokenType.MINUS: operator.neg
+}
 
 class BinOp(ASTNode):
+    __slots__ = ('left', 'op', 'right', 'fn')
+    
     def __init__(self, left, op, right):
         self.left = left
         self.op = op
         self.right = right
+        self.fn = _BINARY_OPERATORS[op[0]]
         
     def __repr__(self):
         return f"BinOp({self.left}, {self.op}, {self.right})"
 
 class UnaryOp(ASTNode):
+    __slots__ = ('op', 'expr', 'fn')
+    
     def __init__(self, op, expr):
         self.op = op
         self.expr = expr
+        self.fn = _UNARY_OPERATORS[op[0]]
         
     def __repr__(self):
         return f"UnaryOp({self.op}, {self.expr})"
 
 class Number(ASTNode):
+    __slots__ = ('token', 'value')
+    
     def __init__(self, token):
         self.token = token
-        self.value = token.value
+        self.value = token[1]
         
     def __repr__(self):
         return f"Number({self.value})"
 
 class String(ASTNode):
+    __slots__ = ('token', 'value')
+    
     def __init__(self, token):
         self.token = token
-        self.value = token.value
+        self.value = token[1]
         
     def __repr__(self):
         return f"String('{self.value}')"
 
 class Variable(ASTNode):
+    __slots__ = ('token', 'name', 'slot', 'is_global')
+    
     def __init__(self, token):
         self.token = token
-        self.name = token.value
+        self.name = token[1]
+        # Filled in by the Resolver
+        self.slot = None
+        self.is_global = False
         
     def __repr__(self):
         return f"Variable({self.name})"
 
 class Assign(ASTNode):
+    __slots__ = ('left', 'op', 'right', 'slot')
+    
     def __init__(self, left, op, right):
         self.left = left
         self.op = op
         self.right = right
+        self.slot = None
         
     def __repr__(self):
         return f"Assign({self.left}, {self.op}, {self.right})"
 
 class Print(ASTNode):
+    __slots__ = ('expr',)
+    
     def __init__(self, expr):
         self.expr = expr
         
@@ -324,6 +288,8 @@ class Print(ASTNode):
         return f"Print({self.expr})"
 
 class Compound(ASTNode):
+    __slots__ = ('statements',)
+    
     def __init__(self, statements):
         self.statements = statements
         
@@ -331,51 +297,91 @@ class Compound(ASTNode):
         return f"Compound({self.statements})"
 
 class If(ASTNode):
+    __slots__ = ('condition', 'if_body', 'else_body', 'test')
+    
     def __init__(self, condition, if_body, else_body=None):
         self.condition = condition
         self.if_body = if_body
         self.else_body = else_body
+        # Python-compiled condition, set by the resolver when it is numeric
+        self.test = None
         
     def __repr__(self):
         return f"If({self.condition}, {self.if_body}, {self.else_body})"
 
 class While(ASTNode):
+    __slots__ = ('condition', 'body', 'test')
+    
     def __init__(self, condition, body):
         self.condition = condition
         self.body = body
+        self.test = None
         
     def __repr__(self):
         return f"While({self.condition}, {self.body})"
 
+class CountedLoop(ASTNode):
+    # Built by specialize_loops from `while (var < limit)` loops whose body
+    # contains a single unconditional `var = var + 1`
+    __slots__ = ('var', 'limit', 'condition', 'body', 'test')
+    
+    def __init__(self, var, limit, condition, body):
+        self.var = var
+        self.limit = limit
+        # Kept for counters that turn out not to be integers at run time
+        self.condition = condition
+        self.body = body
+        self.test = None
+        
+    def __repr__(self):
+        return f"CountedLoop({self.var}, {self.limit}, {self.body})"
+
 # OOP AST nodes
 class Class(ASTNode):
+    __slots__ = ('name', 'parent_name', 'body', 'field_slots')
+    
     def __init__(self, name, parent_name, body):
         self.name = name
         self.parent_name = parent_name
         self.body = body
+        # Slots of the inherited fields visible to field initializers
+        self.field_slots = {}
         
     def __repr__(self):
         return f"Class({self.name}, extends={self.parent_name}, {self.body})"
 
 class Method(ASTNode):
+    __slots__ = ('name', 'params', 'body', 'frame_size', 'code')
+    
     def __init__(self, name, params, body):
         self.name = name
         self.params = params
         self.body = body
+        # Frame layout: 'this' in slot 0, parameters in 1..n, then locals
+        self.frame_size = len(params) + 1
+        # Bytecode for the body, compiled by the VM on first call
+        self.code = None
         
     def __repr__(self):
         return f"Method({self.name}, {self.params}, {self.body})"
 
 class MethodCall(ASTNode):
+    __slots__ = ('object_expr', 'method_name', 'args', '_cached_cls', '_cached_method')
+    
     def __init__(self, object_expr, method_name, args):
         self.object_expr = object_expr
         self.method_name = method_name
         self.args = args
+        # Inline cache: the receiver class seen last time and the method it resolved to
+        self._cached_cls = None
+        self._cached_method = None
         
     def __repr__(self):
         return f"MethodCall({self.object_expr}, {self.method_name}, {self.args})"
 
 class New(ASTNode):
+    __slots__ = ('class_name', 'args')
+    
     def __init__(self, class_name, args):
         self.class_name = class_name
         self.args = args
@@ -384,20 +390,28 @@ class New(ASTNode):
         return f"New({self.class_name}, {self.args})"
 
 class This(ASTNode):
+    __slots__ = ('slot',)
+    
     def __init__(self):
-        pass
+        # Slot of 'this' in the enclosing method frame; None outside methods
+        self.slot = None
         
     def __repr__(self):
         return "This"
 
 class Super(ASTNode):
+    __slots__ = ('slot',)
+    
     def __init__(self):
-        pass
+        # Slot of 'this' in the enclosing method frame; None outside methods
+        self.slot = None
         
     def __repr__(self):
         return "Super"
 
 class Return(ASTNode):
+    __slots__ = ('expr',)
+    
     def __init__(self, expr):
         self.expr = expr
         
@@ -405,56 +419,65 @@ class Return(ASTNode):
         return f"Return({self.expr})"
 
 class Parser:
-    def __init__(self, tokens):
-        self.tokens = tokens
-        self.position = 0
-        self.current_token = self.tokens[0]
+    # Accepts any token iterable, including Lexer.iter_tokens() directly;
+    # only the current token and one token of lookahead are held.
+    def __init__(self, tokens, lexer=None):
+        self._tokens = iter(tokens)
+        self.lexer = lexer
+        self.current_token = next(self._tokens)
+        self._next = next(self._tokens, None)
         
     def advance(self):
-        self.position += 1
-        if self.position < len(self.tokens):
-            self.current_token = self.tokens[self.position]
+        # Past the end the parser stays on the final (EOF) token
+        following = self._next
+        if following is not None:
+            self.current_token = following
+            self._next = next(self._tokens, None)
             
     def peek(self):
-        peek_pos = self.position + 1
-        if peek_pos < len(self.tokens):
-            return self.tokens[peek_pos]
-        return None
+        return self._next
+        
+    def location(self):
+        # Tokens only carry a source offset; the lexer knows where lines start
+        pos = self.current_token[2]
+        if self.lexer is not None:
+            line, column = self.lexer.line_column(pos)
+            return f"line {line}, column {column}"
+        return f"offset {pos}"
             
     def eat(self, token_type):
-        if self.current_token.type == token_type:
+        if self.current_token[0] == token_type:
             current = self.current_token
             self.advance()
             return current
         else:
-            line, column = self.current_token.line, self.current_token.column
-            raise SyntaxError(f"Expected {token_type}, got {self.current_token.type} at line {line}, column {column}")
+            raise SyntaxError(f"Expected {token_name(token_type)}, got {token_name(self.current_token[0])} at {self.location()}")
             
     def program(self):
         statements = []
         
-        while self.current_token.type != TokenType.EOF:
-            if self.current_token.type == TokenType.CLASS:
+        while self.current_token[0] != TokenType.EOF:
+            if self.current_token[0] == TokenType.CLASS:
                 statements.append(self.class_declaration())
             else:
                 statements.append(self.statement())
             
-        return Compound(statements)
+        return Compound(self.flatten(statements))
         
     def class_declaration(self):
         self.eat(TokenType.CLASS)
-        class_name = self.eat(TokenType.IDENTIFIER).value
+        class_name = self.eat(TokenType.IDENTIFIER)[1]
         
         parent_name = None
-        if self.current_token.type == TokenType.EXTENDS:
+        if self.current_token[0] == TokenType.EXTENDS:
             self.eat(TokenType.EXTENDS)
-            parent_name = self.eat(TokenType.IDENTIFIER).value
+            parent_name = self.eat(TokenType.IDENTIFIER)[1]
             
         self.eat(TokenType.LBRACE)
         
         body = []
-        while self.current_token.type != TokenType.RBRACE:
-            if self.current_token.type == TokenType.FUNCTION:
+        while self.current_token[0] != TokenType.RBRACE:
+            if self.current_token[0] == TokenType.FUNCTION:
                 body.append(self.method_declaration())
             else:
                 body.append(self.statement())
@@ -465,18 +488,18 @@ class Parser:
         
     def method_declaration(self):
         self.eat(TokenType.FUNCTION)
-        method_name = self.eat(TokenType.IDENTIFIER).value
+        method_name = self.eat(TokenType.IDENTIFIER)[1]
         
         self.eat(TokenType.LPAREN)
         params = []
         
         # Parse parameters
-        if self.current_token.type != TokenType.RPAREN:
-            params.append(self.eat(TokenType.IDENTIFIER).value)
+        if self.current_token[0] != TokenType.RPAREN:
+            params.append(self.eat(TokenType.IDENTIFIER)[1])
             
-            while self.current_token.type == TokenType.COMMA:
+            while self.current_token[0] == TokenType.COMMA:
                 self.eat(TokenType.COMMA)
-                params.append(self.eat(TokenType.IDENTIFIER).value)
+                params.append(self.eat(TokenType.IDENTIFIER)[1])
                 
         self.eat(TokenType.RPAREN)
         
@@ -486,19 +509,20 @@ class Parser:
         return Method(method_name, params, body)
         
     def statement(self):
-        if self.current_token.type == TokenType.PRINT:
+        if self.current_token[0] == TokenType.PRINT:
             return self.print_statement()
-        elif self.current_token.type == TokenType.IF:
+        elif self.current_token[0] == TokenType.IF:
             return self.if_statement()
-        elif self.current_token.type == TokenType.WHILE:
+        elif self.current_token[0] == TokenType.WHILE:
             return self.while_statement()
-        elif self.current_token.type == TokenType.LBRACE:
+        elif self.current_token[0] == TokenType.LBRACE:
             return self.compound_statement()
-        elif self.current_token.type == TokenType.RETURN:
+        elif self.current_token[0] == TokenType.RETURN:
             return self.return_statement()
-        elif self.current_token.type == TokenType.IDENTIFIER:
+        elif self.current_token[0] == TokenType.IDENTIFIER:
             # Check if it's an assignment or a method call
-            if self.peek() and self.peek().type in (TokenType.ASSIGN, TokenType.DOT):
+            following = self._next
+            if following and following[0] in (TokenType.ASSIGN, TokenType.DOT):
                 return self.assignment_or_method_call()
             else:
                 expr = self.expr()
@@ -526,7 +550,7 @@ class Parser:
     def assignment_or_method_call(self):
         var_token = self.eat(TokenType.IDENTIFIER)
         
-        if self.current_token.type == TokenType.DOT:
+        if self.current_token[0] == TokenType.DOT:
             # Method call
             object_expr = Variable(var_token)
             return self.method_call_statement(object_expr)
@@ -545,15 +569,15 @@ class Parser:
         
     def method_call(self, object_expr):
         self.eat(TokenType.DOT)
-        method_name = self.eat(TokenType.IDENTIFIER).value
+        method_name = self.eat(TokenType.IDENTIFIER)[1]
         
         self.eat(TokenType.LPAREN)
         args = []
         
-        if self.current_token.type != TokenType.RPAREN:
+        if self.current_token[0] != TokenType.RPAREN:
             args.append(self.expr())
             
-            while self.current_token.type == TokenType.COMMA:
+            while self.current_token[0] == TokenType.COMMA:
                 self.eat(TokenType.COMMA)
                 args.append(self.expr())
                 
@@ -570,7 +594,7 @@ class Parser:
         if_body = self.statement()
         
         else_body = None
-        if self.current_token.type == TokenType.ELSE:
+        if self.current_token[0] == TokenType.ELSE:
             self.eat(TokenType.ELSE)
             else_body = self.statement()
             
@@ -588,11 +612,25 @@ class Parser:
         self.eat(TokenType.LBRACE)
         statements = []
         
-        while self.current_token.type != TokenType.RBRACE:
+        while self.current_token[0] != TokenType.RBRACE:
             statements.append(self.statement())
             
         self.eat(TokenType.RBRACE)
-        return Compound(statements)
+        return Compound(self.flatten(statements))
+        
+    def flatten(self, statements):
+        # Splice nested blocks into their parent so running a block is one loop.
+        # Inner blocks were flattened when parsed, so one level is enough; empty
+        # blocks stay, since a trailing {} still makes the block's value None.
+        if not any(isinstance(statement, Compound) for statement in statements):
+            return statements
+        flat = []
+        for statement in statements:
+            if isinstance(statement, Compound) and statement.statements:
+                flat.extend(statement.statements)
+            else:
+                flat.append(statement)
+        return flat
         
     def expr(self):
         return self.assignment_expr()
@@ -601,7 +639,7 @@ class Parser:
         node = self.comparison()
         
         # Handle chained method calls: obj.method1().method2()
-        while self.current_token.type == TokenType.DOT:
+        while self.current_token[0] == TokenType.DOT:
             node = self.method_call(node)
             
         return node
@@ -609,7 +647,7 @@ class Parser:
     def comparison(self):
         node = self.arithmetic()
         
-        while self.current_token.type in (TokenType.EQUAL, TokenType.NOT_EQUAL, TokenType.LESS, TokenType.GREATER):
+        while self.current_token[0] in (TokenType.EQUAL, TokenType.NOT_EQUAL, TokenType.LESS, TokenType.GREATER):
             token = self.current_token
             self.advance()
             node = BinOp(node, token, self.arithmetic())
@@ -619,7 +657,7 @@ class Parser:
     def arithmetic(self):
         node = self.term()
         
-        while self.current_token.type in (TokenType.PLUS, TokenType.MINUS):
+        while self.current_token[0] in (TokenType.PLUS, TokenType.MINUS):
             token = self.current_token
             self.advance()
             node = BinOp(node, token, self.term())
@@ -629,7 +667,7 @@ class Parser:
     def term(self):
         node = self.factor()
         
-        while self.current_token.type in (TokenType.MULTIPLY, TokenType.DIVIDE):
+        while self.current_token[0] in (TokenType.MULTIPLY, TokenType.DIVIDE):
             token = self.current_token
             self.advance()
             node = BinOp(node, token, self.factor())
@@ -639,46 +677,46 @@ class Parser:
     def factor(self):
         token = self.current_token
         
-        if token.type == TokenType.PLUS:
+        if token[0] == TokenType.PLUS:
             self.advance()
             return UnaryOp(token, self.factor())
-        elif token.type == TokenType.MINUS:
+        elif token[0] == TokenType.MINUS:
             self.advance()
             return UnaryOp(token, self.factor())
-        elif token.type == TokenType.INTEGER:
+        elif token[0] == TokenType.INTEGER:
             self.advance()
             return Number(token)
-        elif token.type == TokenType.FLOAT:
+        elif token[0] == TokenType.FLOAT:
             self.advance()
             return Number(token)
-        elif token.type == TokenType.STRING:
+        elif token[0] == TokenType.STRING:
             self.advance()
             return String(token)
-        elif token.type == TokenType.LPAREN:
+        elif token[0] == TokenType.LPAREN:
             self.advance()
             node = self.expr()
             self.eat(TokenType.RPAREN)
             return node
-        elif token.type == TokenType.IDENTIFIER:
+        elif token[0] == TokenType.IDENTIFIER:
             self.advance()
             return Variable(token)
-        elif token.type == TokenType.THIS:
+        elif token[0] == TokenType.THIS:
             self.advance()
             return This()
-        elif token.type == TokenType.SUPER:
+        elif token[0] == TokenType.SUPER:
             self.advance()
             return Super()
-        elif token.type == TokenType.NEW:
+        elif token[0] == TokenType.NEW:
             self.advance()
-            class_name = self.eat(TokenType.IDENTIFIER).value
+            class_name = self.eat(TokenType.IDENTIFIER)[1]
             
             self.eat(TokenType.LPAREN)
             args = []
             
-            if self.current_token.type != TokenType.RPAREN:
+            if self.current_token[0] != TokenType.RPAREN:
                 args.append(self.expr())
                 
-                while self.current_token.type == TokenType.COMMA:
+                while self.current_token[0] == TokenType.COMMA:
                     self.eat(TokenType.COMMA)
                     args.append(self.expr())
                     
@@ -686,55 +724,389 @@ class Parser:
             
             return New(class_name, args)
         else:
-            line, column = token.line, token.column
-            raise SyntaxError(f"Unexpected token {token.type} at line {line}, column {column}")
+            raise SyntaxError(f"Unexpected token {token_name(token[0])} at {self.location()}")
             
     def parse(self):
         return self.program()
 
+def copy_tree(node):
+    # Fresh copy of an AST, so the interpreter's rewriting passes leave the
+    # caller's tree as the parser built it (e.g. for compiling it afterwards)
+    if isinstance(node, list):
+        return [copy_tree(item) for item in node]
+    if not isinstance(node, ASTNode):
+        return node
+    clone = object.__new__(type(node))
+    for cls in type(node).__mro__:
+        for name in getattr(cls, '__slots__', ()):
+            if hasattr(node, name):
+                setattr(clone, name, copy_tree(getattr(node, name)))
+    return clone
+
+# Longest string a folded literal may produce; bigger results are left to run time
+_MAX_FOLDED_STRING = 4096
+
+def _fold_literal(fn, operands, token):
+    values = [operand.value for operand in operands]
+    # A str and an int only combine by repetition; size it before building it
+    if len(values) == 2:
+        text, count = values if isinstance(values[0], str) else values[::-1]
+        if isinstance(text, str) and isinstance(count, int) and len(text) * count > _MAX_FOLDED_STRING:
+            return None
+            
+    try:
+        value = fn(*values)
+    except Exception:
+        # e.g. division by zero or mismatched types: keep the original node
+        return None
+        
+    if isinstance(value, str):
+        if len(value) > _MAX_FOLDED_STRING:
+            return None
+        return String((TokenType.STRING, value, token[2]))
+    if isinstance(value, float):
+        return Number((TokenType.FLOAT, value, token[2]))
+    if isinstance(value, int):
+        return Number((TokenType.INTEGER, value, token[2]))
+    return None
+
+def fold_constants(node):
+    # Collapse BinOp/UnaryOp subtrees whose operands are all literals into a single literal
+    if isinstance(node, BinOp):
+        node.left = fold_constants(node.left)
+        node.right = fold_constants(node.right)
+        if isinstance(node.left, (Number, String)) and isinstance(node.right, (Number, String)):
+            return _fold_literal(node.fn, (node.left, node.right), node.left.token) or node
+    elif isinstance(node, UnaryOp):
+        node.expr = fold_constants(node.expr)
+        if isinstance(node.expr, (Number, String)):
+            return _fold_literal(node.fn, (node.expr,), node.expr.token) or node
+    elif isinstance(node, Compound):
+        node.statements = [fold_constants(statement) for statement in node.statements]
+    elif isinstance(node, Assign):
+        node.right = fold_constants(node.right)
+    elif isinstance(node, (Print, Return)):
+        node.expr = fold_constants(node.expr)
+    elif isinstance(node, If):
+        node.condition = fold_constants(node.condition)
+        node.if_body = fold_constants(node.if_body)
+        node.else_body = fold_constants(node.else_body)
+    elif isinstance(node, While):
+        node.condition = fold_constants(node.condition)
+        node.body = fold_constants(node.body)
+    elif isinstance(node, (Class, Method)):
+        node.body = fold_constants(node.body)
+    elif isinstance(node, MethodCall):
+        node.object_expr = fold_constants(node.object_expr)
+        node.args = [fold_constants(arg) for arg in node.args]
+    elif isinstance(node, New):
+        node.args = [fold_constants(arg) for arg in node.args]
+    return node
+
+def assigned_names(node, names=None):
+    # Names assigned anywhere in a statement tree, in order of appearance
+    if names is None:
+        names = []
+    if isinstance(node, Assign):
+        names.append(node.left.name)
+    elif isinstance(node, Compound):
+        for statement in node.statements:
+            assigned_names(statement, names)
+    elif isinstance(node, If):
+        assigned_names(node.if_body, names)
+        if node.else_body:
+            assigned_names(node.else_body, names)
+    elif isinstance(node, (While, CountedLoop)):
+        assigned_names(node.body, names)
+    return names
+
+def _is_increment(statement, name):
+    # Matches `name = name + 1`
+    return (isinstance(statement, Assign) and statement.left.name == name
+            and isinstance(statement.right, BinOp) and statement.right.op[0] == TokenType.PLUS
+            and isinstance(statement.right.left, Variable) and statement.right.left.name == name
+            and isinstance(statement.right.right, Number) and type(statement.right.right.value) is int
+            and statement.right.right.value == 1)
+
+def _counted_loop(node):
+    condition = node.condition
+    if not (isinstance(condition, BinOp) and condition.op[0] == TokenType.LESS
+            and isinstance(condition.left, Variable)
+            and isinstance(condition.right, Number) and type(condition.right.value) is int
+            and isinstance(node.body, Compound)):
+        return None
+        
+    # The counter must be bumped exactly once per iteration and never written otherwise
+    name = condition.left.name
+    increments = [s for s in node.body.statements if _is_increment(s, name)]
+    if len(increments) != 1 or assigned_names(node.body).count(name) != 1:
+        return None
+    return CountedLoop(condition.left, condition.right.value, condition, node.body)
+
+def specialize_loops(node):
+    # Replace counter-driven while loops with CountedLoop nodes
+    if isinstance(node, Compound):
+        node.statements = [specialize_loops(statement) for statement in node.statements]
+    elif isinstance(node, If):
+        node.if_body = specialize_loops(node.if_body)
+        node.else_body = specialize_loops(node.else_body)
+    elif isinstance(node, (Class, Method)):
+        node.body = specialize_loops(node.body)
+    elif isinstance(node, While):
+        node.body = specialize_loops(node.body)
+        return _counted_loop(node) or node
+    return node
+
+# ====== RESOLVER ======
+class _Undefined:
+    # Comparing or testing an unassigned slot is a TypeError, like arithmetic
+    # on it already is, so compiled conditions never silently read it
+    __slots__ = ()
+    
+    def _unusable(self, *args):
+        raise TypeError("unassigned variable slot")
+        
+    __eq__ = __ne__ = __lt__ = __gt__ = __bool__ = _unusable
+    __hash__ = object.__hash__
+
+# Marks a variable slot that has not been assigned yet
+_UNDEFINED = _Undefined()
+
+_PYTHON_OPERATORS = {
+    TokenType.PLUS: '+',
+    TokenType.MINUS: '-',
+    TokenType.MULTIPLY: '*',
+    TokenType.DIVIDE: '/',
+    TokenType.EQUAL: '==',
+    TokenType.NOT_EQUAL: '!=',
+    TokenType.LESS: '<',
+    TokenType.GREATER: '>'
+}
+
+def _condition_source(node):
+    # Python source for a resolved numeric expression over the frame `e`
+    # and global environment `g`, or None if it uses anything else
+    if isinstance(node, Number):
+        value = node.value
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        return repr(value)
+    if isinstance(node, Variable):
+        return f"{'g' if node.is_global else 'e'}[{node.slot}]"
+    if isinstance(node, BinOp):
+        left = _condition_source(node.left)
+        right = _condition_source(node.right)
+        if left is None or right is None:
+            return None
+        return f"({left} {_PYTHON_OPERATORS[node.op[0]]} {right})"
+    if isinstance(node, UnaryOp):
+        operand = _condition_source(node.expr)
+        if operand is None:
+            return None
+        return f"({_PYTHON_OPERATORS[node.op[0]]}{operand})"
+    return None
+
+def compile_condition(node):
+    # Function of (env, global_env) for a resolved numeric condition, or None
+    # if it involves strings, objects or calls. It raises TypeError wherever
+    # the tree-walker has to step in (an unassigned slot, a non-numeric value).
+    try:
+        source = _condition_source(node)
+        if source is None:
+            return None
+        # Truth-testing inside the lambda makes a bare unassigned variable raise
+        # here too, rather than handing the sentinel back to the caller
+        return eval(compile(f"lambda e, g: True if {source} else False", '<condition>', 'eval'), {})
+    except (SyntaxError, RecursionError, MemoryError):
+        # Too deeply nested for Python's parser; leave it to the tree-walker
+        return None
+
+# Assigns every variable an integer slot: a method's frame holds 'this', its
+# parameters and the names it assigns; everything else is global
+class Resolver:
+    def __init__(self):
+        self.global_slots = {}
+        self.class_fields = {}
+        # Name -> slot map of the enclosing method or class body; None at top level
+        self.scope = None
+        
+    def resolve(self, tree):
+        self.visit(tree)
+        return tree
+        
+    def visit(self, node):
+        method_name = f'resolve_{type(node).__name__}'
+        visitor = getattr(self, method_name, self.generic_visit)
+        return visitor(node)
+        
+    def generic_visit(self, node):
+        raise NotImplementedError(f"No resolve_{type(node).__name__} method defined")
+        
+    def global_slot(self, name):
+        slot = self.global_slots.get(name)
+        if slot is None:
+            slot = self.global_slots[name] = len(self.global_slots)
+        return slot
+        
+    def resolve_Number(self, node):
+        pass
+        
+    def resolve_String(self, node):
+        pass
+        
+    def resolve_BinOp(self, node):
+        self.visit(node.left)
+        self.visit(node.right)
+        
+    def resolve_UnaryOp(self, node):
+        self.visit(node.expr)
+        
+    def resolve_Variable(self, node):
+        if self.scope is not None and node.name in self.scope:
+            node.slot = self.scope[node.name]
+            node.is_global = False
+        else:
+            node.slot = self.global_slot(node.name)
+            node.is_global = True
+            
+    def resolve_Assign(self, node):
+        self.visit(node.right)
+        if self.scope is None:
+            node.slot = self.global_slot(node.left.name)
+        else:
+            node.slot = self.scope[node.left.name]
+            
+    def resolve_Print(self, node):
+        self.visit(node.expr)
+        
+    def resolve_Compound(self, node):
+        for statement in node.statements:
+            self.visit(statement)
+            
+    def resolve_If(self, node):
+        self.visit(node.condition)
+        node.test = compile_condition(node.condition)
+        self.visit(node.if_body)
+        if node.else_body:
+            self.visit(node.else_body)
+            
+    def resolve_While(self, node):
+        self.visit(node.condition)
+        node.test = compile_condition(node.condition)
+        self.visit(node.body)
+        
+    def resolve_CountedLoop(self, node):
+        # The counter is the Variable on the left of the condition
+        self.visit(node.condition)
+        node.test = compile_condition(node.condition)
+        self.visit(node.body)
+        
+    def resolve_Class(self, node):
+        inherited = self.class_fields.get(node.parent_name, [])
+        node.field_slots = {name: slot for slot, name in enumerate(inherited)}
+        
+        fields = []
+        for statement in node.body.statements:
+            if isinstance(statement, Method):
+                self.visit(statement)
+            elif isinstance(statement, Assign):
+                self.scope = node.field_slots
+                self.visit(statement.right)
+                self.scope = None
+                fields.append(statement.left.name)
+                
+        self.class_fields[node.name] = fields
+        
+    def resolve_Method(self, node):
+        scope = {'this': 0}
+        for slot, param in enumerate(node.params, 1):
+            scope[param] = slot
+            
+        frame_size = len(node.params) + 1
+        for name in assigned_names(node.body):
+            if name not in scope:
+                scope[name] = frame_size
+                frame_size += 1
+                
+        outer = self.scope
+        self.scope = scope
+        self.visit(node.body)
+        self.scope = outer
+        node.frame_size = frame_size
+        
+    def resolve_MethodCall(self, node):
+        self.visit(node.object_expr)
+        for arg in node.args:
+            self.visit(arg)
+            
+    def resolve_New(self, node):
+        for arg in node.args:
+            self.visit(arg)
+            
+    def resolve_This(self, node):
+        node.slot = self.scope.get('this') if self.scope is not None else None
+        
+    def resolve_Super(self, node):
+        node.slot = self.scope.get('this') if self.scope is not None else None
+        
+    def resolve_Return(self, node):
+        if node.expr:
+            self.visit(node.expr)
+
 # ====== INTERPRETER ======
+# Prefix for the attributes that hold fields on generated classes
+_FIELD_PREFIX = 'f_'
+
+# Base of the generated slotted classes; '_methods' and '_defaults' (keyed by
+# _FIELD_PREFIX'd slot name) include everything inherited
+class Instance:
+    __slots__ = ()
+    
+    def __repr__(self):
+        fields = ', '.join(f"{slot[len(_FIELD_PREFIX):]}={getattr(self, slot)!r}" for slot in self._defaults)
+        return f"{type(self).__name__}({fields})"
+
 class Interpreter:
     def __init__(self):
-        self.global_env = {}
+        self.global_env = []
         self.classes = {}
+        self.resolver = Resolver()
+        # Bound visitor for each AST node class, so visit() is a single dict lookup
+        self._dispatch = {
+            BinOp: self.visit_BinOp,
+            UnaryOp: self.visit_UnaryOp,
+            Number: self.visit_Number,
+            String: self.visit_String,
+            Variable: self.visit_Variable,
+            Assign: self.visit_Assign,
+            Print: self.visit_Print,
+            Compound: self.visit_Compound,
+            If: self.visit_If,
+            While: self.visit_While,
+            CountedLoop: self.visit_CountedLoop,
+            Class: self.visit_Class,
+            Method: self.visit_Method,
+            MethodCall: self.visit_MethodCall,
+            New: self.visit_New,
+            This: self.visit_This,
+            Super: self.visit_Super,
+            Return: self.visit_Return
+        }
         
     def visit(self, node, env=None):
         if env is None:
             env = self.global_env
             
-        method_name = f'visit_{type(node).__name__}'
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node, env)
+        return self._dispatch.get(type(node), self.generic_visit)(node, env)
         
     def generic_visit(self, node, env):
         raise NotImplementedError(f"No visit_{type(node).__name__} method defined")
         
     def visit_BinOp(self, node, env):
-        left = self.visit(node.left, env)
-        right = self.visit(node.right, env)
-        
-        if node.op.type == TokenType.PLUS:
-            return left + right
-        elif node.op.type == TokenType.MINUS:
-            return left - right
-        elif node.op.type == TokenType.MULTIPLY:
-            return left * right
-        elif node.op.type == TokenType.DIVIDE:
-            return left / right
-        elif node.op.type == TokenType.EQUAL:
-            return left == right
-        elif node.op.type == TokenType.NOT_EQUAL:
-            return left != right
-        elif node.op.type == TokenType.LESS:
-            return left < right
-        elif node.op.type == TokenType.GREATER:
-            return left > right
+        return node.fn(self.visit(node.left, env), self.visit(node.right, env))
             
     def visit_UnaryOp(self, node, env):
-        if node.op.type == TokenType.PLUS:
-            return +self.visit(node.expr, env)
-        elif node.op.type == TokenType.MINUS:
-            return -self.visit(node.expr, env)
+        return node.fn(self.visit(node.expr, env))
             
     def visit_Number(self, node, env):
         return node.value
@@ -743,17 +1115,23 @@ class Interpreter:
         return node.value
         
     def visit_Variable(self, node, env):
-        var_name = node.name
-        if var_name not in env:
-            if var_name not in self.global_env:
-                raise NameError(f"Variable '{var_name}' is not defined")
-            return self.global_env[var_name]
-        return env[var_name]
+        value = (self.global_env if node.is_global else env)[node.slot]
+        if value is _UNDEFINED:
+            return self.lookup_global(node)
+        return value
+        
+    def lookup_global(self, node):
+        # A local that has not been assigned yet falls back to the global of the same name
+        slot = self.resolver.global_slots.get(node.name)
+        if not node.is_global and slot is not None:
+            value = self.global_env[slot]
+            if value is not _UNDEFINED:
+                return value
+        raise NameError(f"Variable '{node.name}' is not defined")
         
     def visit_Assign(self, node, env):
-        var_name = node.left.name
         value = self.visit(node.right, env)
-        env[var_name] = value
+        env[node.slot] = value
         return value
         
     def visit_Print(self, node, env):
@@ -763,12 +1141,20 @@ class Interpreter:
         
     def visit_Compound(self, node, env):
         result = None
+        visit = self.visit
         for statement in node.statements:
-            result = self.visit(statement, env)
+            result = visit(statement, env)
         return result
         
     def visit_If(self, node, env):
-        condition = self.visit(node.condition, env)
+        test = node.test
+        if test is None:
+            condition = self.visit(node.condition, env)
+        else:
+            try:
+                condition = test(env, self.global_env)
+            except TypeError:
+                condition = self.visit(node.condition, env)
         if condition:
             return self.visit(node.if_body, env)
         elif node.else_body:
@@ -776,39 +1162,69 @@ class Interpreter:
             
     def visit_While(self, node, env):
         result = None
-        while self.visit(node.condition, env):
+        test = node.test
+        if test is None:
+            while self.visit(node.condition, env):
+                result = self.visit(node.body, env)
+            return result
+            
+        global_env = self.global_env
+        while True:
+            try:
+                condition = test(env, global_env)
+            except TypeError:
+                # Unassigned or non-numeric operands need the full evaluator
+                condition = self.visit(node.condition, env)
+            if not condition:
+                return result
             result = self.visit(node.body, env)
+        
+    def visit_CountedLoop(self, node, env):
+        start = self.visit(node.var, env)
+        if type(start) is not int:
+            # Only integer counters can be driven by range()
+            return self.visit_While(node, env)
+            
+        # The body keeps the counter in step; the condition need not be re-checked
+        result = None
+        body = node.body
+        visit = self.visit
+        for _ in range(start, node.limit):
+            result = visit(body, env)
         return result
         
     def visit_Class(self, node, env):
         class_name = node.name
-        parent_name = node.parent_name
+        parent = self.classes.get(node.parent_name) if node.parent_name else None
         
-        # Create class definition
-        class_def = {
-            'name': class_name,
-            'parent': parent_name,
-            'methods': {},
-            'fields': {}
-        }
+        # Start from the parent's flattened tables so lookups never walk the chain
+        methods = dict(parent._methods) if parent else {}
+        defaults = dict(parent._defaults) if parent else {}
         
-        # Process class body
-        class_env = {}
-        if parent_name and parent_name in self.classes:
-            for field, value in self.classes[parent_name]['fields'].items():
-                class_env[field] = value
+        # Field initializers see the parent's fields
+        class_env = [_UNDEFINED] * len(node.field_slots)
+        if parent:
+            for field, slot in node.field_slots.items():
+                class_env[slot] = parent._defaults.get(_FIELD_PREFIX + field, _UNDEFINED)
                 
+        # Process class body
         for statement in node.body.statements:
             if isinstance(statement, Method):
-                class_def['methods'][statement.name] = statement
+                methods[statement.name] = statement
             elif isinstance(statement, Assign):
-                field_name = statement.left.name
-                field_value = self.visit(statement.right, class_env)
-                class_def['fields'][field_name] = field_value
+                defaults[_FIELD_PREFIX + statement.left.name] = self.visit(statement.right, class_env)
                 
+        # Generate a slotted Python class; inherited fields already have slots in the parent
+        inherited = parent._defaults if parent else {}
+        cls = type(class_name, (parent or Instance,), {
+            '__slots__': tuple(slot for slot in defaults if slot not in inherited),
+            '_methods': methods,
+            '_defaults': defaults
+        })
+        
         # Register class
-        self.classes[class_name] = class_def
-        return class_def
+        self.classes[class_name] = cls
+        return cls
         
     def visit_Method(self, node, env):
         return node
@@ -817,34 +1233,34 @@ class Interpreter:
         # Evaluate the object
         obj = self.visit(node.object_expr, env)
         
-        if not isinstance(obj, dict) or 'class' not in obj:
+        # Same receiver class as last time: reuse the already checked method
+        cls = type(obj)
+        if cls is node._cached_cls:
+            return self.invoke(node._cached_method, obj, node.args, env)
+            
+        if not isinstance(obj, Instance):
             raise TypeError(f"Cannot call method '{node.method_name}' on non-object value")
             
         # Find method in object's class
-        class_name = obj['class']
-        class_def = self.classes[class_name]
-        
-        if node.method_name not in class_def['methods']:
-            if class_def['parent'] and class_def['parent'] in self.classes:
-                parent_class = self.classes[class_def['parent']]
-                if node.method_name in parent_class['methods']:
-                    method = parent_class['methods'][node.method_name]
-                else:
-                    raise AttributeError(f"Method '{node.method_name}' not found in class '{class_name}' or its parents")
-            else:
-                raise AttributeError(f"Method '{node.method_name}' not found in class '{class_name}'")
-        else:
-            method = class_def['methods'][node.method_name]
+        try:
+            method = cls._methods[node.method_name]
+        except KeyError:
+            raise AttributeError(f"Method '{node.method_name}' not found in class '{cls.__name__}' or its parents") from None
             
-        # Create method environment with 'this' binding
-        method_env = {'this': obj}
-        
         # Evaluate and bind arguments
         if len(method.params) != len(node.args):
             raise TypeError(f"Method '{node.method_name}' expects {len(method.params)} arguments but got {len(node.args)}")
             
-        for param, arg in zip(method.params, node.args):
-            method_env[param] = self.visit(arg, env)
+        node._cached_cls = cls
+        node._cached_method = method
+        return self.invoke(method, obj, node.args, env)
+        
+    def invoke(self, method, obj, args, env):
+        # Create method frame with 'this' in slot 0 and the arguments after it
+        method_env = [_UNDEFINED] * method.frame_size
+        method_env[0] = obj
+        for slot, arg in enumerate(args, 1):
+            method_env[slot] = self.visit(arg, env)
             
         # Execute method body
         return self.visit(method.body, method_env)
@@ -855,58 +1271,45 @@ class Interpreter:
         if class_name not in self.classes:
             raise NameError(f"Class '{class_name}' not defined")
             
-        class_def = self.classes[class_name]
-        
-        # Create new object
-        obj = {
-            'class': class_name,
-            'fields': {}
-        }
+        cls = self.classes[class_name]
         
-        # Copy fields from class definition
-        for field, value in class_def['fields'].items():
-            obj['fields'][field] = value
+        # Create new object with the field values from the class definition
+        obj = cls.__new__(cls)
+        for slot, value in cls._defaults.items():
+            setattr(obj, slot, value)
             
         # Call constructor if exists
-        if 'init' in class_def['methods']:
-            constructor = class_def['methods']['init']
-            
-            # Create method environment with 'this' binding
-            method_env = {'this': obj}
-            
+        constructor = cls._methods.get('init')
+        if constructor is not None:
             # Evaluate and bind arguments
             if len(constructor.params) != len(node.args):
                 raise TypeError(f"Constructor expects {len(constructor.params)} arguments but got {len(node.args)}")
                 
-            for param, arg in zip(constructor.params, node.args):
-                method_env[param] = self.visit(arg, env)
-                
             # Execute constructor body
-            self.visit(constructor.body, method_env)
+            self.invoke(constructor, obj, node.args, env)
             
         return obj
         
     def visit_This(self, node, env):
-        if 'this' not in env:
+        if node.slot is None:
             raise SyntaxError("'this' can only be used within a method")
-        return env['this']
+        return env[node.slot]
         
     def visit_Super(self, node, env):
-        if 'this' not in env:
+        if node.slot is None:
             raise SyntaxError("'super' can only be used within a method")
             
-        obj = env['this']
-        class_name = obj['class']
-        class_def = self.classes[class_name]
+        obj = env[node.slot]
+        parent = type(obj).__base__
         
-        if not class_def['parent']:
-            raise TypeError(f"Class '{class_name}' has no parent class")
+        if parent is Instance:
+            raise TypeError(f"Class '{type(obj).__name__}' has no parent class")
+            
+        # A copy of 'this' that dispatches through the parent class
+        super_obj = parent.__new__(parent)
+        for slot in parent._defaults:
+            setattr(super_obj, slot, getattr(obj, slot))
             
-        # Create a proxy object that behaves like 'this' but with parent class
-        # Continue from the Super method implementation
-        super_obj = dict(obj)
-        super_obj['class'] = class_def['parent'] # This line was incomplete in the original
-        
         return super_obj
         
     def visit_Return(self, node, env):
@@ -914,12 +1317,435 @@ class Interpreter:
             return self.visit(node.expr, env)
         return None
         
+    def prepare(self, tree):
+        tree = self.resolver.resolve(specialize_loops(fold_constants(copy_tree(tree))))
+        # Make room for any globals the resolver has just introduced
+        self.global_env.extend([_UNDEFINED] * (len(self.resolver.global_slots) - len(self.global_env)))
+        return tree
+        
     def interpret(self, tree):
+        tree = self.prepare(tree)
         return self.visit(tree, self.global_env)
 
+# ====== BYTECODE VM ======
+(LOAD_CONST, LOAD_LOCAL, LOAD_GLOBAL, STORE_SLOT, POP, BINARY_OP, UNARY_OP,
+ JUMP, JUMP_IF_FALSE, PRINT, LOAD_METHOD, CALL_METHOD, NEW, CALL_INIT,
+ THIS, SUPER, CLASS, RANGE_ITER, FOR_ITER, SET_RESULT, TEST_JUMP) = range(21)
+
+# Flattens a resolved AST into (opcode, arg) pairs; every statement and
+# expression leaves one value on the stack, like the Interpreter's return values
+class BytecodeCompiler:
+    def __init__(self):
+        self.code = []
+        
+    def compile(self, tree):
+        self.code = []
+        self.visit(tree)
+        return self.code
+        
+    def visit(self, node):
+        method_name = f'compile_{type(node).__name__}'
+        visitor = getattr(self, method_name, self.generic_visit)
+        return visitor(node)
+        
+    def generic_visit(self, node):
+        raise NotImplementedError(f"No compile_{type(node).__name__} method defined")
+        
+    def emit(self, op, arg=None):
+        self.code.append((op, arg))
+        return len(self.code) - 1
+        
+    def patch(self, index, target):
+        # Point a previously emitted jump at target
+        op, arg = self.code[index]
+        if op == TEST_JUMP:
+            # Emitted with the node whose compiled test it runs
+            target = (arg, target)
+        self.code[index] = (op, target)
+        
+    def compile_Number(self, node):
+        self.emit(LOAD_CONST, node.value)
+        
+    def compile_String(self, node):
+        self.emit(LOAD_CONST, node.value)
+        
+    def compile_BinOp(self, node):
+        self.visit(node.left)
+        self.visit(node.right)
+        self.emit(BINARY_OP, node.fn)
+        
+    def compile_UnaryOp(self, node):
+        self.visit(node.expr)
+        self.emit(UNARY_OP, node.fn)
+        
+    def compile_Variable(self, node):
+        self.emit(LOAD_GLOBAL if node.is_global else LOAD_LOCAL, (node.slot, node))
+        
+    def compile_Assign(self, node):
+        self.visit(node.right)
+        self.emit(STORE_SLOT, node.slot)
+        
+    def compile_Print(self, node):
+        self.visit(node.expr)
+        self.emit(PRINT)
+        
+    def compile_Compound(self, node):
+        if not node.statements:
+            self.emit(LOAD_CONST, None)
+            return
+            
+        # Only the last statement's value is kept
+        for index, statement in enumerate(node.statements):
+            if index:
+                self.emit(POP)
+            self.visit(statement)
+            
+    def compile_test(self, node):
+        # Conditions with a compiled test take a single instruction
+        if node.test is None:
+            self.visit(node.condition)
+            return self.emit(JUMP_IF_FALSE)
+        return self.emit(TEST_JUMP, node)
+        
+    def compile_If(self, node):
+        jump_to_else = self.compile_test(node)
+        self.visit(node.if_body)
+        jump_to_end = self.emit(JUMP)
+        
+        self.patch(jump_to_else, len(self.code))
+        if node.else_body:
+            self.visit(node.else_body)
+        else:
+            self.emit(LOAD_CONST, None)
+        self.patch(jump_to_end, len(self.code))
+        
+    def compile_While(self, node):
+        # The loop's value is its last body value, None if it never runs
+        self.emit(LOAD_CONST, None)
+        self.compile_loop(node)
+        
+    def compile_loop(self, node):
+        # Expects the loop's current value on top of the stack
+        loop_start = len(self.code)
+        jump_to_end = self.compile_test(node)
+        self.emit(POP)
+        self.visit(node.body)
+        self.emit(JUMP, loop_start)
+        self.patch(jump_to_end, len(self.code))
+        
+    def compile_CountedLoop(self, node):
+        # Integer counters iterate a range; anything else takes the general loop
+        self.emit(LOAD_CONST, None)
+        self.visit(node.var)
+        range_index = self.emit(RANGE_ITER)
+        loop_start = len(self.code)
+        jump_to_end = self.emit(FOR_ITER)
+        self.visit(node.body)
+        self.emit(SET_RESULT)
+        self.emit(JUMP, loop_start)
+        generic_start = len(self.code)
+        self.compile_loop(node)
+        self.patch(range_index, (node.limit, generic_start))
+        self.patch(jump_to_end, len(self.code))
+        
+    def compile_Class(self, node):
+        self.emit(CLASS, node)
+        
+    def compile_Method(self, node):
+        self.emit(LOAD_CONST, node)
+        
+    def compile_MethodCall(self, node):
+        self.visit(node.object_expr)
+        self.emit(LOAD_METHOD, node)
+        for arg in node.args:
+            self.visit(arg)
+        self.emit(CALL_METHOD, len(node.args))
+        
+    def compile_New(self, node):
+        # NEW jumps past the arguments when the class has no constructor
+        new_index = self.emit(NEW)
+        for arg in node.args:
+            self.visit(arg)
+        self.emit(CALL_INIT, len(node.args))
+        self.patch(new_index, (node, len(self.code)))
+        
+    def compile_This(self, node):
+        self.emit(THIS, node)
+        
+    def compile_Super(self, node):
+        self.emit(SUPER, node)
+        
+    def compile_Return(self, node):
+        if node.expr:
+            self.visit(node.expr)
+        else:
+            self.emit(LOAD_CONST, None)
+
+# Stack machine for bytecode; class bodies run once through the tree-walking
+# visitors, method bodies are compiled on their first call
+class VM(Interpreter):
+    def __init__(self):
+        super().__init__()
+        handlers = {
+            LOAD_CONST: self.op_load_const,
+            LOAD_LOCAL: self.op_load_local,
+            LOAD_GLOBAL: self.op_load_global,
+            STORE_SLOT: self.op_store_slot,
+            POP: self.op_pop,
+            BINARY_OP: self.op_binary_op,
+            UNARY_OP: self.op_unary_op,
+            JUMP: self.op_jump,
+            JUMP_IF_FALSE: self.op_jump_if_false,
+            PRINT: self.op_print,
+            LOAD_METHOD: self.op_load_method,
+            CALL_METHOD: self.op_call_method,
+            NEW: self.op_new,
+            CALL_INIT: self.op_call_init,
+            THIS: self.op_this,
+            SUPER: self.op_super,
+            CLASS: self.op_class,
+            RANGE_ITER: self.op_range_iter,
+            FOR_ITER: self.op_for_iter,
+            SET_RESULT: self.op_set_result,
+            TEST_JUMP: self.op_test_jump
+        }
+        # Indexed by opcode
+        self._handlers = [handlers[op] for op in range(len(handlers))]
+        
+    def interpret(self, tree):
+        tree = self.prepare(tree)
+        return self.run(BytecodeCompiler().compile(tree), self.global_env)
+        
+    def run(self, code, env):
+        stack = []
+        handlers = self._handlers
+        pc = 0
+        end = len(code)
+        while pc < end:
+            op, arg = code[pc]
+            pc = handlers[op](stack, arg, env, pc)
+        return stack[-1]
+        
+    def call(self, method, obj, args):
+        if method.code is None:
+            method.code = BytecodeCompiler().compile(method.body)
+        frame = [obj, *args]
+        frame.extend([_UNDEFINED] * (method.frame_size - len(frame)))
+        return self.run(method.code, frame)
+        
+    def invoke(self, method, obj, args, env):
+        # Calls made from tree-walked code (e.g. 'new' in a field initializer)
+        return self.call(method, obj, [self.visit(arg, env) for arg in args])
+        
+    def op_load_const(self, stack, arg, env, pc):
+        stack.append(arg)
+        return pc + 1
+        
+    def op_load_local(self, stack, arg, env, pc):
+        value = env[arg[0]]
+        if value is _UNDEFINED:
+            value = self.lookup_global(arg[1])
+        stack.append(value)
+        return pc + 1
+        
+    def op_load_global(self, stack, arg, env, pc):
+        value = self.global_env[arg[0]]
+        if value is _UNDEFINED:
+            value = self.lookup_global(arg[1])
+        stack.append(value)
+        return pc + 1
+        
+    def op_store_slot(self, stack, arg, env, pc):
+        env[arg] = stack[-1]
+        return pc + 1
+        
+    def op_pop(self, stack, arg, env, pc):
+        stack.pop()
+        return pc + 1
+        
+    def op_binary_op(self, stack, arg, env, pc):
+        right = stack.pop()
+        stack[-1] = arg(stack[-1], right)
+        return pc + 1
+        
+    def op_unary_op(self, stack, arg, env, pc):
+        stack[-1] = arg(stack[-1])
+        return pc + 1
+        
+    def op_jump(self, stack, arg, env, pc):
+        return arg
+        
+    def op_jump_if_false(self, stack, arg, env, pc):
+        return pc + 1 if stack.pop() else arg
+        
+    def op_test_jump(self, stack, arg, env, pc):
+        node, target = arg
+        try:
+            result = node.test(env, self.global_env)
+        except TypeError:
+            result = self.visit(node.condition, env)
+        return pc + 1 if result else target
+        
+    def op_range_iter(self, stack, arg, env, pc):
+        start = stack.pop()
+        if type(start) is not int:
+            return arg[1]
+        stack.append(iter(range(start, arg[0])))
+        return pc + 1
+        
+    def op_for_iter(self, stack, arg, env, pc):
+        for _ in stack[-1]:
+            return pc + 1
+        stack.pop()
+        return arg
+        
+    def op_set_result(self, stack, arg, env, pc):
+        value = stack.pop()
+        stack[-2] = value
+        return pc + 1
+        
+    def op_print(self, stack, arg, env, pc):
+        print(stack[-1])
+        return pc + 1
+        
+    def op_load_method(self, stack, node, env, pc):
+        # Same checks and inline cache as Interpreter.visit_MethodCall
+        obj = stack[-1]
+        cls = type(obj)
+        if cls is not node._cached_cls:
+            if not isinstance(obj, Instance):
+                raise TypeError(f"Cannot call method '{node.method_name}' on non-object value")
+                
+            try:
+                method = cls._methods[node.method_name]
+            except KeyError:
+                raise AttributeError(f"Method '{node.method_name}' not found in class '{cls.__name__}' or its parents") from None
+                
+            if len(method.params) != len(node.args):
+                raise TypeError(f"Method '{node.method_name}' expects {len(method.params)} arguments but got {len(node.args)}")
+                
+            node._cached_cls = cls
+            node._cached_method = method
+            
+        stack.append(node._cached_method)
+        return pc + 1
+        
+    def op_call_method(self, stack, argc, env, pc):
+        args = stack[len(stack) - argc:]
+        del stack[len(stack) - argc:]
+        method = stack.pop()
+        stack[-1] = self.call(method, stack[-1], args)
+        return pc + 1
+        
+    def op_new(self, stack, arg, env, pc):
+        node, skip = arg
+        class_name = node.class_name
+        
+        if class_name not in self.classes:
+            raise NameError(f"Class '{class_name}' not defined")
+            
+        cls = self.classes[class_name]
+        obj = cls.__new__(cls)
+        for slot, value in cls._defaults.items():
+            setattr(obj, slot, value)
+        stack.append(obj)
+        
+        # Without a constructor the arguments are never evaluated
+        constructor = cls._methods.get('init')
+        if constructor is None:
+            return skip
+            
+        if len(constructor.params) != len(node.args):
+            raise TypeError(f"Constructor expects {len(constructor.params)} arguments but got {len(node.args)}")
+            
+        stack.append(constructor)
+        return pc + 1
+        
+    def op_call_init(self, stack, argc, env, pc):
+        args = stack[len(stack) - argc:]
+        del stack[len(stack) - argc:]
+        constructor = stack.pop()
+        self.call(constructor, stack[-1], args)
+        return pc + 1
+        
+    def op_this(self, stack, node, env, pc):
+        stack.append(self.visit_This(node, env))
+        return pc + 1
+        
+    def op_super(self, stack, node, env, pc):
+        stack.append(self.visit_Super(node, env))
+        return pc + 1
+        
+    def op_class(self, stack, node, env, pc):
+        stack.append(self.visit_Class(node, env))
+        return pc + 1
+
 # ====== LLVM COMPILER ======
+# Shared LLVM types and constants; llvmlite builds a new object per constructor call
+I32 = ir.IntType(32)
+I8 = ir.IntType(8)
+I8P = ir.PointerType(I8)
+F32 = ir.FloatType()
+ZERO32 = ir.Constant(I32, 0)
+
+# Interned i32 constants for the literals loops and conditions use most
+_SMALL_INT_CONSTANTS = {value: ir.Constant(I32, value) for value in range(-128, 128)}
+_SMALL_INT_CONSTANTS[0] = ZERO32
+
+def _flush_c_stdout():
+    # Flush what printf wrote into the C runtime's stdout buffer
+    if os.name == 'nt':
+        ctypes.cdll.msvcrt.fflush(None)
+    else:
+        ctypes.CDLL(None).fflush(None)
+
+# printf formats defined once in the prelude module, by global name
+_PRELUDE_STRINGS = {
+    "int_format": "%d\n",
+    "float_format": "%f\n",
+    "string_format": "%s\n"
+}
+
+def _string_constant(string):
+    # Encode once and null-terminate in place; llvmlite only renders
+    # bytearray (not bytes) as a c"..." array constant
+    data = bytearray(string.encode("utf8"))
+    data.append(0)
+    return ir.Constant(ir.ArrayType(I8, len(data)), data)
+
 class Compiler:
-    def __init__(self):
+    # IRBuilder method names for (int, float) operands
+    _ARITH = {
+        TokenType.PLUS: ('add', 'fadd'),
+        TokenType.MINUS: ('sub', 'fsub'),
+        TokenType.MULTIPLY: ('mul', 'fmul'),
+        TokenType.DIVIDE: ('sdiv', 'fdiv')
+    }
+    
+    # (builder, operand) -> result; unary plus doesn't change anything
+    _UNARY = {
+        TokenType.PLUS: lambda builder, expr: expr,
+        TokenType.MINUS: lambda builder, expr: builder.neg(expr) if isinstance(expr.type, ir.IntType) else builder.fneg(expr)
+    }
+    
+    # Predicates for icmp_signed / fcmp_ordered
+    _CMP = {
+        TokenType.EQUAL: '==',
+        TokenType.NOT_EQUAL: '!=',
+        TokenType.LESS: '<',
+        TokenType.GREATER: '>'
+    }
+    
+    # Parsed runtime prelude; see prelude()
+    _prelude = None
+    
+    def __init__(self, opt_level=1, verify=False):
+        self.opt_level = opt_level
+        # Run the LLVM verifier on every module; parse errors are always reported
+        self.verify = verify
+        self._pass_manager = None
+        self._target_machine = None
+        self._engine = None
         self.global_env = {}
         self.classes = {}
         self.current_module = None
@@ -930,101 +1756,192 @@ class Compiler:
         self.continue_blocks = []
         self.return_values = []
         self.function_return_type = None
+        # Node type -> bound compile_* method, filled in as node types are seen
+        self._dispatch = {}
         
     def initialize_module(self, name):
         # Initialize module and add runtime functions
         self.current_module = ir.Module(name=name)
+        self.current_module.triple = llvm.get_default_triple()
+        # String value -> its global in this module, so each literal is emitted once
+        self._string_pool = {}
+        # Numbers the str_N globals of string literals
+        self._string_counter = 0
+        # Method name -> compiled function in this module
+        self._func_table = {}
         
         # Declare external C functions
-        printf_ty = ir.FunctionType(ir.IntType(32), [ir.PointerType(ir.IntType(8))], var_arg=True)
+        printf_ty = ir.FunctionType(I32, [I8P], var_arg=True)
         self.printf_func = ir.Function(self.current_module, printf_ty, name="printf")
         
-        # Define integer to string conversion function
-        int_to_string_ty = ir.FunctionType(
-            ir.PointerType(ir.IntType(8)), [ir.IntType(32)]
-        )
-        self.int_to_string_func = ir.Function(
-            self.current_module, int_to_string_ty, name="int_to_string"
-        )
-        
         # Define main function
-        main_ty = ir.FunctionType(ir.IntType(32), [])
+        main_ty = ir.FunctionType(I32, [])
         self.main_func = ir.Function(self.current_module, main_ty, name="main")
         
-        # Create entry block for main function
-        entry_block = self.main_func.append_basic_block(name="entry")
-        self.current_builder = ir.IRBuilder(entry_block)
+        # Function -> builder that appends allocas to that function's entry block
+        self._entry_builders = {}
+        # Variables and classes belong to the module being built
+        self.global_env = {}
+        self.classes = {}
+        self.current_function = self.main_func
+        self.current_builder = self.begin_function(self.main_func)
         
         # Initialize runtime
         self.initialize_runtime()
         
     def initialize_runtime(self):
-        # Add global string constants
-        self.int_format_str = self.add_global_string("%d\n", "int_format")
-        self.float_format_str = self.add_global_string("%f\n", "float_format")
-        self.string_format_str = self.add_global_string("%s\n", "string_format")
+        # The format strings are defined in the prelude; only external
+        # declarations are built here, and they join the string pool
+        self.int_format_str = self.prelude_string("int_format")
+        self.float_format_str = self.prelude_string("float_format")
+        self.string_format_str = self.prelude_string("string_format")
+        
+    def prelude_string(self, name):
+        string = _PRELUDE_STRINGS[name]
+        global_str = ir.GlobalVariable(self.current_module, _string_constant(string).type, name=name)
+        global_str.global_constant = True
+        self._string_pool[string] = global_str
+        return global_str
+        
+    @classmethod
+    def prelude(cls):
+        # Runtime definitions shared by every module, built and parsed once
+        # per process and linked into each compiled module
+        if cls._prelude is None:
+            module = ir.Module(name="prelude")
+            module.triple = llvm.get_default_triple()
+            int_to_string_ty = ir.FunctionType(I8P, [I32])
+            ir.Function(module, int_to_string_ty, name="int_to_string")
+            for name, string in _PRELUDE_STRINGS.items():
+                str_const = _string_constant(string)
+                global_str = ir.GlobalVariable(module, str_const.type, name=name)
+                global_str.global_constant = True
+                global_str.initializer = str_const
+            cls._prelude = llvm.parse_assembly(str(module))
+        return cls._prelude
+        
+    def pooled_string(self, string):
+        global_str = self._string_pool.get(string)
+        if global_str is None:
+            name = f"str_{self._string_counter}"
+            self._string_counter += 1
+            global_str = self.add_global_string(string, name)
+            self._string_pool[string] = global_str
+        return global_str
         
     def add_global_string(self, string, name):
-        # Add null terminator
-        string_with_null = string + "\0"
         # Create global constant for string
-        str_const = ir.Constant(ir.ArrayType(ir.IntType(8), len(string_with_null)),
-                              bytearray(string_with_null.encode("utf8")))
+        str_const = _string_constant(string)
         global_str = ir.GlobalVariable(self.current_module, str_const.type, name=name)
         global_str.global_constant = True
         global_str.initializer = str_const
         return global_str
         
+    def begin_function(self, func):
+        # The entry block only holds allocas; code goes into a separate body
+        # block so the two builders never share an instruction list.
+        # finish_function adds the branch between them.
+        entry_block = func.append_basic_block(name="entry")
+        body_block = func.append_basic_block(name="body")
+        self._entry_builders[func] = ir.IRBuilder(entry_block)
+        return ir.IRBuilder(body_block)
+        
+    def finish_function(self, func):
+        # The body block is always the second block begin_function created
+        self._entry_builders[func].branch(func.basic_blocks[1])
+        
     def get_string_pointer(self, global_str):
-        zero = ir.Constant(ir.IntType(32), 0)
-        return self.current_builder.gep(global_str, [zero, zero], inbounds=True)
+        return self.current_builder.gep(global_str, [ZERO32, ZERO32], inbounds=True)
         
-    def compile(self, tree, output_file):
+    def build_main(self, tree, name):
         # Initialize module
-        self.initialize_module(output_file)
+        self.initialize_module(name)
         
         # Compile AST
         self.visit(tree)
         
-        # Add return 0 at the end of main
-        self.current_builder.ret(ir.Constant(ir.IntType(32), 0))
+        # Add return 0 at the end of main, unless it already returned
+        if not self.current_builder.block.is_terminated:
+            self.current_builder.ret(ZERO32)
+        self.finish_function(self.main_func)
+        
+    def build_module_ref(self, tree, name):
+        # ir.Module only renders to text, so the module is serialized exactly
+        # once here; everything downstream works on the ModuleRef
+        self.build_main(tree, name)
+        ir_text = str(self.current_module)
+        mod_ref = llvm.parse_assembly(ir_text)
+        mod_ref.link_in(self.prelude(), preserve=True)
+        if self.verify:
+            mod_ref.verify()
+        return mod_ref
         
-        # Verify module
-        llvm.parse_assembly(str(self.current_module))
+    def compile(self, tree, output_file):
+        # Assemble and link in one driver run
+        self.link_executable(output_file, self.emit_assembly(tree, output_file))
         
-        # Optimize module
-        pmb = llvm.create_pass_manager_builder()
-        pmb.opt_level = 2
-        pm = llvm.create_module_pass_manager()
-        pmb.populate(pm)
-        pm.run(self.current_module)
+    def emit_assembly(self, tree, module_name):
+        mod_ref = self.build_module_ref(tree, module_name)
         
-        # Generate object file
-        target_machine = self.get_target_machine()
-        with open(f"{output_file}.o", "wb") as f:
-            f.write(target_machine.emit_object(self.current_module))
-            
-        # Link object file to create executable
-        self.link_executable(output_file)
+        # Optimize module
+        self.pass_manager().run(mod_ref)
+        return self.get_target_machine().emit_assembly(mod_ref)
+        
+    def pass_manager(self):
+        # Built once per Compiler and reused for every module it compiles;
+        # -O1 gets most of the benefit of -O2 for this straight-line code
+        if self._pass_manager is None:
+            pmb = llvm.create_pass_manager_builder()
+            pmb.opt_level = self.opt_level
+            self._pass_manager = llvm.create_module_pass_manager()
+            pmb.populate(self._pass_manager)
+        return self._pass_manager
+        
+    def jit_compile(self, tree):
+        # Compile in memory through MCJIT and return main() as a ctypes function;
+        # it stays valid until the next jit_compile replaces the engine
+        mod_ref = self.build_module_ref(tree, "jit")
+        
+        # The engine takes ownership of its target machine, so it can't share the cached one
+        target_machine = llvm.Target.from_default_triple().create_target_machine()
+        self._engine = llvm.create_mcjit_compiler(mod_ref, target_machine)
+        self._engine.finalize_object()
+        return ctypes.CFUNCTYPE(ctypes.c_int)(self._engine.get_function_address("main"))
+        
+    def run_main(self, main):
+        # printf buffers separately from sys.stdout; keep the output ordered
+        sys.stdout.flush()
+        result = main()
+        _flush_c_stdout()
+        return result
         
     def get_target_machine(self):
-        # Get host CPU details
-        target = llvm.Target.from_default_triple()
-        target_machine = target.create_target_machine()
-        return target_machine
-        
-    def link_executable(self, output_file):
-        # Use system compiler (gcc/clang) to link the object file
+        # Get host CPU details; the machine is reused for every module. Code is
+        # position independent so cc can link it into a PIE without text relocations
+        if self._target_machine is None:
+            target = llvm.Target.from_default_triple()
+            self._target_machine = target.create_target_machine(reloc="pic")
+        return self._target_machine
+        
+    @staticmethod
+    def link_command(output_file):
+        # Use system compiler (gcc/clang) to assemble and link; the assembly
+        # is piped in on stdin, so no intermediate object file is written
         if os.name == 'nt':  # Windows
             compiler = 'gcc'
         else:  # Linux/Mac
             compiler = 'cc'
-            
-        subprocess.run([compiler, f"{output_file}.o", "-o", output_file])
+        return [compiler, "-x", "assembler", "-", "-o", output_file]
+        
+    def link_executable(self, output_file, assembly):
+        subprocess.run(self.link_command(output_file), input=assembly.encode(), check=True)
         
     def visit(self, node):
-        method_name = f'compile_{type(node).__name__}'
-        visitor = getattr(self, method_name, self.generic_visit)
+        node_type = type(node)
+        visitor = self._dispatch.get(node_type)
+        if visitor is None:
+            visitor = getattr(self, f'compile_{node_type.__name__}', self.generic_visit)
+            self._dispatch[node_type] = visitor
         return visitor(node)
         
     def generic_visit(self, node):
@@ -1033,88 +1950,56 @@ class Compiler:
     def compile_Compound(self, node):
         result = None
         for statement in node.statements:
+            # Anything after a return is unreachable and can't follow a terminator
+            if self.current_builder.block.is_terminated:
+                break
             result = self.visit(statement)
         return result
         
     def compile_Number(self, node):
         if isinstance(node.value, int):
-            return ir.Constant(ir.IntType(32), node.value)
+            constant = _SMALL_INT_CONSTANTS.get(node.value)
+            if constant is None:
+                constant = ir.Constant(I32, node.value)
+            return constant
         else:  # float
-            return ir.Constant(ir.FloatType(), node.value)
+            return ir.Constant(F32, node.value)
             
     def compile_String(self, node):
-        # Create global string constant
-        string_name = f"str_{abs(hash(node.value)) % 10000}"
-        global_str = self.add_global_string(node.value, string_name)
-        return self.get_string_pointer(global_str)
+        # Repeated literals share one global constant
+        return self.get_string_pointer(self.pooled_string(node.value))
         
     def compile_BinOp(self, node):
+        builder = self.current_builder
         left = self.visit(node.left)
         right = self.visit(node.right)
         
         # Handle type conversion
         if left.type != right.type:
             if isinstance(left.type, ir.IntType) and isinstance(right.type, ir.FloatType):
-                left = self.current_builder.sitofp(left, ir.FloatType())
+                left = builder.sitofp(left, F32)
             elif isinstance(left.type, ir.FloatType) and isinstance(right.type, ir.IntType):
-                right = self.current_builder.sitofp(right, ir.FloatType())
+                right = builder.sitofp(right, F32)
                 
-        # Arithmetic operations
-        if node.op.type == TokenType.PLUS:
-            if isinstance(left.type, ir.IntType):
-                return self.current_builder.add(left, right)
-            else:
-                return self.current_builder.fadd(left, right)
-        elif node.op.type == TokenType.MINUS:
-            if isinstance(left.type, ir.IntType):
-                return self.current_builder.sub(left, right)
-            else:
-                return self.current_builder.fsub(left, right)
-        elif node.op.type == TokenType.MULTIPLY:
-            if isinstance(left.type, ir.IntType):
-                return self.current_builder.mul(left, right)
-            else:
-                return self.current_builder.fmul(left, right)
-        elif node.op.type == TokenType.DIVIDE:
-            if isinstance(left.type, ir.IntType):
-                return self.current_builder.sdiv(left, right)
+        # One table lookup picks the integer or float instruction
+        is_float = not isinstance(left.type, ir.IntType)
+        arith = self._ARITH.get(node.op[0])
+        if arith:
+            return getattr(builder, arith[is_float])(left, right)
+            
+        predicate = self._CMP.get(node.op[0])
+        if predicate:
+            if is_float:
+                cmp_result = builder.fcmp_ordered(predicate, left, right)
             else:
-                return self.current_builder.fdiv(left, right)
+                cmp_result = builder.icmp_signed(predicate, left, right)
                 
-        # Comparison operations
-        elif node.op.type in (TokenType.EQUAL, TokenType.NOT_EQUAL, TokenType.LESS, TokenType.GREATER):
-            if isinstance(left.type, ir.IntType):
-                if node.op.type == TokenType.EQUAL:
-                    cmp_result = self.current_builder.icmp_signed('==', left, right)
-                elif node.op.type == TokenType.NOT_EQUAL:
-                    cmp_result = self.current_builder.icmp_signed('!=', left, right)
-                elif node.op.type == TokenType.LESS:
-                    cmp_result = self.current_builder.icmp_signed('<', left, right)
-                elif node.op.type == TokenType.GREATER:
-                    cmp_result = self.current_builder.icmp_signed('>', left, right)
-            else:  # Float comparison
-                if node.op.type == TokenType.EQUAL:
-                    cmp_result = self.current_builder.fcmp_ordered('==', left, right)
-                elif node.op.type == TokenType.NOT_EQUAL:
-                    cmp_result = self.current_builder.fcmp_ordered('!=', left, right)
-                elif node.op.type == TokenType.LESS:
-                    cmp_result = self.current_builder.fcmp_ordered('<', left, right)
-                elif node.op.type == TokenType.GREATER:
-                    cmp_result = self.current_builder.fcmp_ordered('>', left, right)
-                    
             # Convert bool to int
-            return self.current_builder.zext(cmp_result, ir.IntType(32))
+            return builder.zext(cmp_result, I32)
             
     def compile_UnaryOp(self, node):
         expr = self.visit(node.expr)
-        
-        if node.op.type == TokenType.PLUS:
-            return expr  # Unary plus doesn't change anything
-        elif node.op.type == TokenType.MINUS:
-            if isinstance(expr.type, ir.IntType):
-                return self.current_builder.neg(expr)
-            else:
-                return self.current_builder.fneg(expr)
+        return self._UNARY[node.op[0]](self.current_builder, expr)
                 
     def compile_Variable(self, node):
         var_name = node.name
@@ -1124,15 +2009,16 @@ class Compiler:
         return self.current_builder.load(self.global_env[var_name])
         
     def compile_Assign(self, node):
+        builder = self.current_builder
         var_name = node.left.name
         value = self.visit(node.right)
         
         if var_name not in self.global_env:
             # Create a new variable allocation
             if isinstance(value.type, ir.IntType):
-                alloca = self.create_entry_block_alloca(var_name, ir.IntType(32))
+                alloca = self.create_entry_block_alloca(var_name, I32)
             elif isinstance(value.type, ir.FloatType):
-                alloca = self.create_entry_block_alloca(var_name, ir.FloatType())
+                alloca = self.create_entry_block_alloca(var_name, F32)
             elif isinstance(value.type, ir.PointerType):
                 # Assuming string or object
                 alloca = self.create_entry_block_alloca(var_name, value.type)
@@ -1142,39 +2028,41 @@ class Compiler:
             self.global_env[var_name] = alloca
             
         # Store the value
-        self.current_builder.store(value, self.global_env[var_name])
+        builder.store(value, self.global_env[var_name])
         return value
         
     def create_entry_block_alloca(self, name, type):
-        # Create an allocation at the entry point of the function
-        builder = ir.IRBuilder()
-        builder.position_at_start(self.main_func.entry_basic_block)
-        return builder.alloca(type, name=name)
+        # Create an allocation in the entry block of the current function
+        return self._entry_builders[self.current_function].alloca(type, name=name)
         
     def compile_Print(self, node):
+        builder = self.current_builder
         value = self.visit(node.expr)
         
         if isinstance(value.type, ir.IntType):
             format_str = self.get_string_pointer(self.int_format_str)
-            self.current_builder.call(self.printf_func, [format_str, value])
+            builder.call(self.printf_func, [format_str, value])
         elif isinstance(value.type, ir.FloatType):
             format_str = self.get_string_pointer(self.float_format_str)
-            self.current_builder.call(self.printf_func, [format_str, value])
+            # Variadic float arguments are passed as double
+            promoted = builder.fpext(value, ir.DoubleType())
+            builder.call(self.printf_func, [format_str, promoted])
         elif isinstance(value.type, ir.PointerType):
             # Assuming it's a string
             format_str = self.get_string_pointer(self.string_format_str)
-            self.current_builder.call(self.printf_func, [format_str, value])
+            builder.call(self.printf_func, [format_str, value])
         else:
             raise TypeError(f"Cannot print value of type {value.type}")
             
         return value
         
     def compile_If(self, node):
+        builder = self.current_builder
         # Evaluate condition
         condition = self.visit(node.condition)
         
         # Convert condition to a boolean value (i1)
-        condition_bool = self.current_builder.icmp_signed('!=', condition, 
+        condition_bool = builder.icmp_signed('!=', condition, 
                                                      ir.Constant(condition.type, 0))
         
         # Create blocks for the if/else branches and the merge point
@@ -1183,35 +2071,41 @@ class Compiler:
         
         if node.else_body:
             else_block = self.current_function.append_basic_block(name="else")
-            self.current_builder.cbranch(condition_bool, then_block, else_block)
+            builder.cbranch(condition_bool, then_block, else_block)
         else:
-            self.current_builder.cbranch(condition_bool, then_block, merge_block)
+            builder.cbranch(condition_bool, then_block, merge_block)
             
-        # Emit then block
-        self.current_builder.position_at_start(then_block)
+        # Emit then block; a branch that already returned doesn't reach the merge
+        builder.position_at_start(then_block)
         then_value = self.visit(node.if_body)
-        self.current_builder.branch(merge_block)
-        
+        then_falls_through = not builder.block.is_terminated
+        if then_falls_through:
+            builder.branch(merge_block)
+            
         # Retrieve the updated builder position after generating the 'then' block
-        then_block = self.current_builder.block
+        then_block = builder.block
         
         # Emit else block
         else_value = None
+        else_falls_through = False
         if node.else_body:
-            self.current_builder.position_at_start(else_block)
+            builder.position_at_start(else_block)
             else_value = self.visit(node.else_body)
-            self.current_builder.branch(merge_block)
-            
+            else_falls_through = not builder.block.is_terminated
+            if else_falls_through:
+                builder.branch(merge_block)
+                
             # Retrieve the updated builder position after generating the 'else' block
-            else_block = self.current_builder.block
+            else_block = builder.block
             
-        # Emit merge block
-        self.current_builder.position_at_start(merge_block)
+        # Emit merge block; if both branches returned it has no predecessors and
+        # only holds dead code until the function's final terminator
+        builder.position_at_start(merge_block)
         
-        # Create PHI node for merging the results if both branches return a value
-        if then_value is not None and else_value is not None:
+        # Create PHI node for merging the results if both branches reach it with a value
+        if then_falls_through and else_falls_through and then_value is not None and else_value is not None:
             if then_value.type == else_value.type:
-                phi = self.current_builder.phi(then_value.type, name="iftmp")
+                phi = builder.phi(then_value.type, name="iftmp")
                 phi.add_incoming(then_value, then_block)
                 phi.add_incoming(else_value, else_block)
                 return phi
@@ -1219,6 +2113,7 @@ class Compiler:
         return None
         
     def compile_While(self, node):
+        builder = self.current_builder
         # Create blocks for the loop condition, body, and after-loop
         cond_block = self.current_function.append_basic_block(name="while.cond")
         body_block = self.current_function.append_basic_block(name="while.body")
@@ -1229,22 +2124,23 @@ class Compiler:
         self.exit_blocks.append(after_block)
         
         # Jump to the condition block
-        self.current_builder.branch(cond_block)
+        builder.branch(cond_block)
         
         # Emit condition block
-        self.current_builder.position_at_start(cond_block)
+        builder.position_at_start(cond_block)
         condition = self.visit(node.condition)
-        condition_bool = self.current_builder.icmp_signed('!=', condition, 
+        condition_bool = builder.icmp_signed('!=', condition, 
                                                      ir.Constant(condition.type, 0))
-        self.current_builder.cbranch(condition_bool, body_block, after_block)
+        builder.cbranch(condition_bool, body_block, after_block)
         
         # Emit loop body
-        self.current_builder.position_at_start(body_block)
+        builder.position_at_start(body_block)
         self.visit(node.body)
-        self.current_builder.branch(cond_block)
+        if not builder.block.is_terminated:
+            builder.branch(cond_block)
         
         # Position builder at the after block
-        self.current_builder.position_at_start(after_block)
+        builder.position_at_start(after_block)
         
         # Remove blocks from break/continue stacks
         self.continue_blocks.pop()
@@ -1278,26 +2174,24 @@ class Compiler:
         params = node.params
         
         # Create function type
-        param_types = [ir.IntType(32) for _ in params]  # Assuming all params are int for simplicity
-        func_type = ir.FunctionType(ir.IntType(32), param_types)
+        param_types = [I32 for _ in params]  # Assuming all params are int for simplicity
+        func_type = ir.FunctionType(I32, param_types)
         
         # Create function
         func = ir.Function(self.current_module, func_type, name=method_name)
+        self._func_table[method_name] = func
         
         # Name the arguments
         for i, arg in enumerate(func.args):
             arg.name = params[i]
             
-        # Create entry block
-        entry_block = func.append_basic_block(name="entry")
-        
         # Save current function and builder
         prev_function = self.current_function
         prev_builder = self.current_builder
         
         # Set current function and builder
         self.current_function = func
-        self.current_builder = ir.IRBuilder(entry_block)
+        self.current_builder = self.begin_function(func)
         
         # Create allocas for all arguments
         for i, arg in enumerate(func.args):
@@ -1310,7 +2204,8 @@ class Compiler:
         
         # Add a default return if needed
         if not self.current_builder.block.is_terminated:
-            self.current_builder.ret(ir.Constant(ir.IntType(32), 0))
+            self.current_builder.ret(ZERO32)
+        self.finish_function(func)
             
         # Restore previous function and builder
         self.current_function = prev_function
@@ -1328,7 +2223,7 @@ class Compiler:
         # In a real implementation, we would allocate memory for the object and initialize its fields
         
         # Create a dummy integer to represent the object instance
-        return ir.Constant(ir.IntType(32), 1)
+        return _SMALL_INT_CONSTANTS[1]
         
     def compile_MethodCall(self, node):
         # For simplicity, this is a very basic implementation
@@ -1338,23 +2233,22 @@ class Compiler:
         method_name = node.method_name
         
         # Find function in module
-        if method_name in self.current_module.globals:
-            func = self.current_module.globals[method_name]
-            
-            # Prepare arguments
-            args = [self.visit(arg) for arg in node.args]
-            
-            # Call function
-            return self.current_builder.call(func, args)
-        else:
+        func = self._func_table.get(method_name)
+        if func is None:
             raise NameError(f"Method '{method_name}' not found")
             
+        # Prepare arguments
+        args = [self.visit(arg) for arg in node.args]
+        
+        # Call function
+        return self.current_builder.call(func, args)
+            
     def compile_Return(self, node):
         if node.expr:
             value = self.visit(node.expr)
             self.current_builder.ret(value)
         else:
-            self.current_builder.ret(ir.Constant(ir.IntType(32), 0))
+            self.current_builder.ret(ZERO32)
             
         return None
 
@@ -1365,7 +2259,7 @@ def compile_to_executable(source_code, output_file="output"):
     tokens = lexer.tokenize()
     
     # Parse
-    parser = Parser(tokens)
+    parser = Parser(tokens, lexer)
     ast = parser.parse()
     
     # Optional: Interpret for testing
@@ -1379,12 +2273,124 @@ def compile_to_executable(source_code, output_file="output"):
     print(f"Successfully compiled to executable: {output_file}")
     return output_file
 
+def compile_many(sources):
+    # One executable per (source_code, output_file); sharing the Compiler builds
+    # the target machine and pass manager once for the batch
+    compiler = Compiler()
+    outputs = []
+    for source_code, output_file in sources:
+        lexer = Lexer(source_code)
+        ast = Parser(lexer.iter_tokens(), lexer).parse()
+        compiler.compile(ast, output_file)
+        print(f"Successfully compiled to executable: {output_file}")
+        outputs.append(output_file)
+    return outputs
+
+# Node types the LLVM backend compiles faithfully; anything else is interpreted
+_JIT_NODES = (Compound, Number, BinOp, UnaryOp, Variable, Assign, Print, If, While)
+
+def _jit_supported(node):
+    if node is None:
+        return True
+    if not isinstance(node, _JIT_NODES):
+        return False
+    if isinstance(node, Compound):
+        return all(_jit_supported(statement) for statement in node.statements)
+    if isinstance(node, BinOp):
+        return _jit_supported(node.left) and _jit_supported(node.right)
+    if isinstance(node, (UnaryOp, Print)):
+        return _jit_supported(node.expr)
+    if isinstance(node, Assign):
+        return _jit_supported(node.right)
+    if isinstance(node, If):
+        return _jit_supported(node.condition) and _jit_supported(node.if_body) and _jit_supported(node.else_body)
+    if isinstance(node, While):
+        return _jit_supported(node.condition) and _jit_supported(node.body)
+    return True
+
+def run_source(source_code, native=False):
+    # Run a program for its output. native=True runs what the LLVM backend
+    # supports as machine code, with the executable's semantics (32-bit ints,
+    # integer division, no division-by-zero or unassigned-variable checks)
+    # Tokens stream straight from the lexer into the parser
+    lexer = Lexer(source_code)
+    ast = Parser(lexer.iter_tokens(), lexer).parse()
+    
+    if native and _jit_supported(ast):
+        # Verify so that bad code generation falls back instead of crashing
+        compiler = Compiler(verify=True)
+        try:
+            main = compiler.jit_compile(ast)
+        except (TypeError, NameError, RuntimeError):
+            # Code generation or verification failed; interpret instead
+            main = None
+        if main is not None:
+            compiler.run_main(main)
+            return None
+            
+    VM().interpret(ast)
+    return None
+
+def _exec_linker(output_file, assembly):
+    # Linking is the CLI's last step: exec the driver in place of this
+    # process instead of forking and waiting for it, handing the assembly
+    # over as stdin through an in-memory file. Only returns after a
+    # subprocess link where memfd_create is missing; raises OSError if the
+    # driver can't be found or started.
+    command = Compiler.link_command(output_file)
+    driver = shutil.which(command[0])
+    if driver is None:
+        raise FileNotFoundError(f"C compiler '{command[0]}' not found")
+        
+    if not hasattr(os, 'memfd_create'):
+        subprocess.run(command, input=assembly.encode(), check=True)
+        return
+        
+    fd = os.memfd_create("assembly")
+    with open(fd, "wb", closefd=False) as f:
+        f.write(assembly.encode())
+    os.lseek(fd, 0, os.SEEK_SET)
+    os.dup2(fd, 0)
+    # The driver's exit status becomes ours and it reports its own errors
+    print(f"Linking executable: {output_file}")
+    sys.stdout.flush()
+    os.execv(driver, command)
+
 # Command-line interface
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python compiler.py <source_file> [output_file]")
+        print("       python compiler.py --run [--native] <source_file>")
+        print("       python compiler.py --many <source_file>...")
         sys.exit(1)
         
+    if sys.argv[1] == '--run':
+        native = len(sys.argv) > 2 and sys.argv[2] == '--native'
+        run_args = sys.argv[3:] if native else sys.argv[2:]
+        if len(run_args) != 1:
+            print("Usage: python compiler.py --run [--native] <source_file>")
+            sys.exit(1)
+            
+        try:
+            with open(run_args[0], 'r') as f:
+                run_source(f.read(), native)
+        except Exception as e:
+            print(f"Runtime error: {e}")
+            sys.exit(1)
+        sys.exit(0)
+        
+    if sys.argv[1] == '--many':
+        sources = []
+        for source_file in sys.argv[2:]:
+            with open(source_file, 'r') as f:
+                sources.append((f.read(), os.path.splitext(source_file)[0]))
+        try:
+            compile_many(sources)
+        except Exception as e:
+            print(f"Compilation error: {e}")
+            sys.exit(1)
+        sys.exit(0)
+        
     source_file = sys.argv[1]
     output_file = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(source_file)[0]
     
@@ -1392,8 +2398,16 @@ if __name__ == "__main__":
         source_code = f.read()
         
     try:
-        compiled_file = compile_to_executable(source_code, output_file)
-        print(f"Compilation successful. Executable created: {compiled_file}")
+        lexer = Lexer(source_code)
+        ast = Parser(lexer.iter_tokens(), lexer).parse()
+        assembly = Compiler().emit_assembly(ast, output_file)
     except Exception as e:
         print(f"Compilation error: {e}")
         sys.exit(1)
+        
+    try:
+        _exec_linker(output_file, assembly)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Compilation error: {e}")
+        sys.exit(1)
+    print(f"Compilation successful. Executable created: {output_file}")